@@ -3,12 +3,28 @@ import os
 import libsql_experimental as libsql
 from dotenv import load_dotenv
 
+from app.limiter import AdmissionLimiter
+
 # Load environment variables from .env file (for local development)
 load_dotenv()
 
 TURSO_DATABASE_URL = os.getenv("TURSO_DATABASE_URL")
 TURSO_AUTH_TOKEN = os.getenv("TURSO_AUTH_TOKEN")
 
+# Admission control, per worker process: how many requests may use the database
+# at once, how many may wait for a slot, and how long (seconds) they wait before
+# being shed. Across the deployment the totals are these times WEB_CONCURRENCY.
+DB_MAX_IN_FLIGHT = int(os.getenv("DB_MAX_IN_FLIGHT", "10"))
+DB_MAX_QUEUE = int(os.getenv("DB_MAX_QUEUE", "50"))
+DB_QUEUE_TIMEOUT = float(os.getenv("DB_QUEUE_TIMEOUT", "5"))
+DB_RETRY_AFTER = int(os.getenv("DB_RETRY_AFTER", "1"))
+
+# Set once the schema exists, so worker processes started afterwards skip init_db
+DB_SCHEMA_READY_ENV = "DB_SCHEMA_READY"
+
+
+limiter = AdmissionLimiter(DB_MAX_IN_FLIGHT, DB_MAX_QUEUE, DB_QUEUE_TIMEOUT, DB_RETRY_AFTER)
+
 
 def get_db_connection():
     """Get a Turso/libSQL connection."""
@@ -20,6 +36,19 @@ def get_db_connection():
     return libsql.connect(database=TURSO_DATABASE_URL, auth_token=TURSO_AUTH_TOKEN)
 
 
+def ping_db() -> bool:
+    """Return True if the database answers a trivial query."""
+    try:
+        conn = get_db_connection()
+        try:
+            conn.execute("SELECT 1").fetchone()
+        finally:
+            conn.close()
+    except Exception:
+        return False
+    return True
+
+
 def init_db():
     """Initialize the database with required tables."""
     conn = get_db_connection()
@@ -77,3 +106,15 @@ def init_db():
 
     conn.commit()
     conn.close()
+
+
+def init_db_once():
+    """Initialize the database unless this process or its parent already has.
+
+    gunicorn.conf.py calls this in the master before forking workers; they
+    inherit the environment flag and skip the DDL.
+    """
+    if os.getenv(DB_SCHEMA_READY_ENV) == "1":
+        return
+    init_db()
+    os.environ[DB_SCHEMA_READY_ENV] = "1"
@@ -0,0 +1,75 @@
+import asyncio
+
+
+class DatabaseBusyError(Exception):
+    """Raised when the wait queue is full or a slot was not freed in time."""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("Database is busy, please retry shortly.")
+        self.retry_after = retry_after
+
+
+class AdmissionLimiter:
+    """Admit a bounded number of requests at once, with a bounded wait queue.
+
+    A request takes one slot for its whole lifetime, on the event loop, before
+    its handler is given a threadpool thread. A shed request has done no work.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int, timeout: float, retry_after: int = 1):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.waiting = 0
+        self.closed = False
+        self._cond = asyncio.Condition()
+
+    def _has_room(self) -> bool:
+        return self.closed or self.in_flight < self.max_in_flight
+
+    async def acquire(self) -> None:
+        """Take a slot, waiting up to timeout. Raises DatabaseBusyError if shed."""
+        async with self._cond:
+            if self.closed:
+                raise DatabaseBusyError(self.retry_after)
+            if self.in_flight >= self.max_in_flight:
+                if self.waiting >= self.max_queue:
+                    raise DatabaseBusyError(self.retry_after)
+                self.waiting += 1
+                try:
+                    await asyncio.wait_for(self._cond.wait_for(self._has_room), self.timeout)
+                except TimeoutError:
+                    raise DatabaseBusyError(self.retry_after) from None
+                finally:
+                    self.waiting -= 1
+                if self.closed:
+                    raise DatabaseBusyError(self.retry_after)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        """Give back a slot taken by acquire()."""
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    async def open(self) -> None:
+        """Start admitting requests."""
+        async with self._cond:
+            self.closed = False
+
+    async def close(self) -> None:
+        """Stop admitting requests and shed any still waiting."""
+        async with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """Current queue depth and limits."""
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+        }
@@ -1,3 +1,60 @@
-# Define your recipe models here
+from dataclasses import dataclass, field
 
-# how
\ No newline at end of file
+
+@dataclass(slots=True)
+class Cuisine:
+    id: int
+    name: str
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Cuisine":
+        """Build from an (id, name) row."""
+        return cls(row[0], row[1])
+
+
+@dataclass(slots=True)
+class Tag:
+    id: int
+    name: str
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Tag":
+        """Build from an (id, name) row."""
+        return cls(row[0], row[1])
+
+
+@dataclass(slots=True)
+class RecipeUrl:
+    id: int
+    url: str
+    label: str | None = None
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "RecipeUrl":
+        """Build from an (id, url, label) row."""
+        return cls(row[0], row[1], row[2])
+
+
+@dataclass(slots=True)
+class Recipe:
+    id: int
+    name: str
+    notes: str | None
+    created_at: str
+    cuisine: Cuisine
+    urls: list[RecipeUrl] = field(default_factory=list)
+    tags: list[Tag] = field(default_factory=list)
+
+    @classmethod
+    def from_row(
+        cls,
+        row: tuple,
+        urls: list[RecipeUrl] | None = None,
+        tags: list[Tag] | None = None,
+    ) -> "Recipe":
+        """Build from an (id, name, notes, created_at, cuisine_name, cuisine_id) row."""
+        return cls(
+            row[0], row[1], row[2], row[3], Cuisine(row[5], row[4]),
+            urls if urls is not None else [],
+            tags if tags is not None else [],
+        )
@@ -3,16 +3,22 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 
 from app.recipes.service import (
+    add_tag_to_recipes,
     add_url_to_recipe,
     create_recipe,
+    delete_orphans,
     delete_recipe,
+    delete_recipes,
     delete_url,
     get_all_cuisines,
     get_all_recipes,
     get_all_tags,
-    get_or_create_cuisine,
     get_recipe_by_id,
+    merge_cuisines,
+    merge_tags,
+    remove_tag_from_recipes,
     update_recipe,
+    update_recipe_cuisine,
     update_recipe_name,
     update_recipe_tags,
     update_url,
@@ -22,9 +28,12 @@ router = APIRouter(prefix="/recipes", tags=["recipes"])
 templates = Jinja2Templates(directory="templates")
 
 
+# Handlers are plain `def` so FastAPI runs their blocking database calls in its
+# threadpool. The admission middleware in main.py bounds how many run at once.
+
 # Static routes MUST come before dynamic /{recipe_id} routes
 @router.get("", response_class=HTMLResponse)
-async def list_recipes(request: Request):
+def list_recipes(request: Request):
     """Render the recipes list page."""
     recipes = get_all_recipes()
     cuisines = get_all_cuisines()
@@ -37,7 +46,7 @@ async def list_recipes(request: Request):
 
 
 @router.get("/add", response_class=HTMLResponse)
-async def add_recipe_page(request: Request):
+def add_recipe_page(request: Request):
     """Render the add recipe page."""
     cuisines = get_all_cuisines()
     tags = get_all_tags()
@@ -49,7 +58,7 @@ async def add_recipe_page(request: Request):
 
 
 @router.get("/search", response_class=HTMLResponse)
-async def search_recipes(request: Request, q: str = ""):
+def search_recipes(request: Request, q: str = ""):
     """Search recipes by name or tags. Returns partial HTML for HTMX."""
     search_query = q.strip() if q else None
     recipes = get_all_recipes(search_query=search_query)
@@ -61,21 +70,21 @@ async def search_recipes(request: Request, q: str = ""):
 
 
 @router.get("/cuisines", response_class=JSONResponse)
-async def get_cuisines():
+def get_cuisines():
     """Return all cuisines as JSON for autocomplete."""
     cuisines = get_all_cuisines()
-    return [c["name"] for c in cuisines]
+    return [c.name for c in cuisines]
 
 
 @router.get("/tags", response_class=JSONResponse)
-async def get_tags():
+def get_tags():
     """Return all tags as JSON for autocomplete."""
     tags = get_all_tags()
-    return [t["name"] for t in tags]
+    return [t.name for t in tags]
 
 
 @router.post("", response_class=HTMLResponse)
-async def save_recipe(
+def save_recipe(
     request: Request,
     recipe_name: str = Form(...),
     cuisine: str = Form(...),
@@ -84,20 +93,67 @@ async def save_recipe(
     notes: str = Form(""),
 ):
     """Save a new recipe with name, cuisine, URL(s), optional tags, and notes."""
-    cuisine_id = get_or_create_cuisine(cuisine)
     urls = [{"url": recipe_url}] if recipe_url.strip() else None
     tag_list = [t.strip() for t in tags.split(",") if t.strip()] if tags else None
     notes_value = notes.strip() if notes.strip() else None
 
-    create_recipe(name=recipe_name, cuisine_id=cuisine_id, urls=urls, tags=tag_list, notes=notes_value)
+    create_recipe(name=recipe_name, cuisine=cuisine, urls=urls, tags=tag_list, notes=notes_value)
+    response = HTMLResponse(content="")
+    response.headers["HX-Redirect"] = "/"
+    return response
+
+
+# Bulk operations (static paths before dynamic)
+@router.post("/bulk/delete", response_class=HTMLResponse)
+def bulk_delete_recipes(recipe_ids: list[int] = Form(...)):
+    """Delete many recipes at once."""
+    delete_recipes(recipe_ids)
+    response = HTMLResponse(content="")
+    response.headers["HX-Redirect"] = "/"
+    return response
+
+
+@router.post("/bulk/tags", response_class=HTMLResponse)
+def bulk_add_tag(recipe_ids: list[int] = Form(...), tag: str = Form(...)):
+    """Add a tag to many recipes at once."""
+    add_tag_to_recipes(recipe_ids, tag)
     response = HTMLResponse(content="")
     response.headers["HX-Redirect"] = "/"
     return response
 
 
+@router.post("/bulk/tags/remove", response_class=HTMLResponse)
+def bulk_remove_tag(recipe_ids: list[int] = Form(...), tag: str = Form(...)):
+    """Remove a tag from many recipes at once."""
+    remove_tag_from_recipes(recipe_ids, tag)
+    response = HTMLResponse(content="")
+    response.headers["HX-Redirect"] = "/"
+    return response
+
+
+@router.post("/tags/merge", response_class=JSONResponse)
+def merge_tags_endpoint(sources: list[str] = Form(...), target: str = Form(...)):
+    """Merge source tags into a target tag. Also used to rename a tag."""
+    merged = merge_tags(sources, target)
+    return {"merged": merged}
+
+
+@router.post("/cuisines/merge", response_class=JSONResponse)
+def merge_cuisines_endpoint(sources: list[str] = Form(...), target: str = Form(...)):
+    """Merge source cuisines into a target cuisine. Also used to rename a cuisine."""
+    merged = merge_cuisines(sources, target)
+    return {"merged": merged}
+
+
+@router.post("/cleanup", response_class=JSONResponse)
+def cleanup_orphans():
+    """Delete tags and cuisines that no recipe uses."""
+    return delete_orphans()
+
+
 # URL management (static path before dynamic)
 @router.patch("/urls/{url_id}", response_class=HTMLResponse)
-async def edit_url(
+def edit_url(
     request: Request,
     url_id: int,
     url: str = Form(...),
@@ -109,7 +165,7 @@ async def edit_url(
 
 
 @router.delete("/urls/{url_id}", response_class=HTMLResponse)
-async def remove_url(url_id: int):
+def remove_url(url_id: int):
     """Delete a URL."""
     delete_url(url_id)
     return HTMLResponse(content="")
@@ -117,7 +173,7 @@ async def remove_url(url_id: int):
 
 # Dynamic routes with {recipe_id} come AFTER static routes
 @router.get("/{recipe_id}", response_class=HTMLResponse)
-async def view_recipe(request: Request, recipe_id: int):
+def view_recipe(request: Request, recipe_id: int):
     """View a single recipe with edit capabilities."""
     recipe = get_recipe_by_id(recipe_id)
     if not recipe:
@@ -132,7 +188,7 @@ async def view_recipe(request: Request, recipe_id: int):
 
 
 @router.delete("/{recipe_id}", response_class=HTMLResponse)
-async def remove_recipe(recipe_id: int, request: Request):
+def remove_recipe(recipe_id: int, request: Request):
     """Delete a recipe by ID. Returns empty response or redirect header for HTMX."""
     delete_recipe(recipe_id)
     # Check if request came from view page (has HX-Current-URL header with recipe ID)
@@ -143,7 +199,7 @@ async def remove_recipe(recipe_id: int, request: Request):
 
 
 @router.patch("/{recipe_id}", response_class=HTMLResponse)
-async def edit_recipe(
+def edit_recipe(
     request: Request,
     recipe_id: int,
     name: str = Form(None),
@@ -154,8 +210,7 @@ async def edit_recipe(
     if name:
         update_recipe_name(recipe_id, name)
     if cuisine:
-        cuisine_id = get_or_create_cuisine(cuisine)
-        update_recipe(recipe_id, cuisine_id=cuisine_id)
+        update_recipe_cuisine(recipe_id, cuisine)
     if tags is not None:
         tag_list = [t.strip() for t in tags.split(",") if t.strip()]
         update_recipe_tags(recipe_id, tag_list)
@@ -170,7 +225,7 @@ async def edit_recipe(
 
 # Edit form endpoints (GET to show edit form)
 @router.get("/{recipe_id}/edit/name", response_class=HTMLResponse)
-async def show_name_edit(request: Request, recipe_id: int):
+def show_name_edit(request: Request, recipe_id: int):
     """Show the name edit form."""
     recipe = get_recipe_by_id(recipe_id)
     return templates.TemplateResponse(
@@ -181,7 +236,7 @@ async def show_name_edit(request: Request, recipe_id: int):
 
 
 @router.get("/{recipe_id}/edit/cuisine", response_class=HTMLResponse)
-async def show_cuisine_edit(request: Request, recipe_id: int):
+def show_cuisine_edit(request: Request, recipe_id: int):
     """Show the cuisine edit form."""
     recipe = get_recipe_by_id(recipe_id)
     cuisines = get_all_cuisines()
@@ -193,7 +248,7 @@ async def show_cuisine_edit(request: Request, recipe_id: int):
 
 
 @router.get("/{recipe_id}/edit/tags", response_class=HTMLResponse)
-async def show_tags_edit(request: Request, recipe_id: int):
+def show_tags_edit(request: Request, recipe_id: int):
     """Show the tags edit form."""
     recipe = get_recipe_by_id(recipe_id)
     all_tags = get_all_tags()
@@ -205,7 +260,7 @@ async def show_tags_edit(request: Request, recipe_id: int):
 
 
 @router.get("/{recipe_id}/edit/notes", response_class=HTMLResponse)
-async def show_notes_edit(request: Request, recipe_id: int):
+def show_notes_edit(request: Request, recipe_id: int):
     """Show the notes edit form."""
     recipe = get_recipe_by_id(recipe_id)
     return templates.TemplateResponse(
@@ -217,7 +272,7 @@ async def show_notes_edit(request: Request, recipe_id: int):
 
 # Save edit endpoints (PATCH to save and return display partial)
 @router.patch("/{recipe_id}/name", response_class=HTMLResponse)
-async def edit_recipe_name(request: Request, recipe_id: int, name: str = Form(...)):
+def edit_recipe_name(request: Request, recipe_id: int, name: str = Form(...)):
     """Update a recipe's name. Returns the display partial."""
     update_recipe_name(recipe_id, name)
     recipe = get_recipe_by_id(recipe_id)
@@ -229,10 +284,9 @@ async def edit_recipe_name(request: Request, recipe_id: int, name: str = Form(..
 
 
 @router.patch("/{recipe_id}/cuisine", response_class=HTMLResponse)
-async def edit_recipe_cuisine(request: Request, recipe_id: int, cuisine: str = Form(...)):
+def edit_recipe_cuisine(request: Request, recipe_id: int, cuisine: str = Form(...)):
     """Update a recipe's cuisine. Returns the display partial."""
-    cuisine_id = get_or_create_cuisine(cuisine)
-    update_recipe(recipe_id, cuisine_id=cuisine_id)
+    update_recipe_cuisine(recipe_id, cuisine)
     recipe = get_recipe_by_id(recipe_id)
     return templates.TemplateResponse(
         request=request,
@@ -242,7 +296,7 @@ async def edit_recipe_cuisine(request: Request, recipe_id: int, cuisine: str = F
 
 
 @router.patch("/{recipe_id}/tags", response_class=HTMLResponse)
-async def edit_recipe_tags_endpoint(request: Request, recipe_id: int, tags: str = Form("")):
+def edit_recipe_tags_endpoint(request: Request, recipe_id: int, tags: str = Form("")):
     """Update a recipe's tags. Returns the display partial."""
     tag_list = [t.strip() for t in tags.split(",") if t.strip()]
     update_recipe_tags(recipe_id, tag_list)
@@ -255,7 +309,7 @@ async def edit_recipe_tags_endpoint(request: Request, recipe_id: int, tags: str
 
 
 @router.patch("/{recipe_id}/notes", response_class=HTMLResponse)
-async def edit_recipe_notes(request: Request, recipe_id: int, notes: str = Form("")):
+def edit_recipe_notes(request: Request, recipe_id: int, notes: str = Form("")):
     """Update a recipe's notes. Returns the display partial."""
     update_recipe(recipe_id, notes=notes if notes.strip() else None)
     recipe = get_recipe_by_id(recipe_id)
@@ -268,7 +322,7 @@ async def edit_recipe_notes(request: Request, recipe_id: int, notes: str = Form(
 
 # URL management for specific recipe
 @router.post("/{recipe_id}/urls", response_class=HTMLResponse)
-async def add_recipe_url(
+def add_recipe_url(
     request: Request,
     recipe_id: int,
     url: str = Form(...),
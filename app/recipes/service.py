@@ -1,64 +1,66 @@
 from app.database import get_db_connection
+from app.recipes.models import Cuisine, Recipe, RecipeUrl, Tag
+
+
+# Helpers
+def _placeholders(values: list) -> str:
+    """Build a comma-separated list of SQL placeholders for an IN clause."""
+    return ", ".join("?" for _ in values)
+
+
+def _normalize_names(names: list[str]) -> list[str]:
+    """Strip, lowercase and de-duplicate names, dropping empty ones."""
+    return list(dict.fromkeys(n.strip().lower() for n in names if n.strip()))
 
 
 # Cuisine functions
-def get_or_create_cuisine(name: str) -> int:
-    """Get cuisine ID by name, or create if not exists. Name stored lowercase."""
+def _get_or_create_cuisine(conn, name: str) -> int:
+    """Get cuisine ID by name, or create if not exists. Name stored lowercase.
+
+    Runs on the caller's connection without committing, so the cuisine is
+    created in the same transaction as the recipe that uses it.
+    """
     name_lower = name.strip().lower()
-    conn = get_db_connection()
+    conn.execute("INSERT OR IGNORE INTO cuisines (name) VALUES (?)", (name_lower,))
     cursor = conn.execute("SELECT id FROM cuisines WHERE name = ?", (name_lower,))
-    row = cursor.fetchone()
-    if row:
-        cuisine_id = row[0]
-    else:
-        cursor = conn.execute("INSERT INTO cuisines (name) VALUES (?)", (name_lower,))
-        conn.commit()
-        cuisine_id = cursor.lastrowid
-    conn.close()
-    return cuisine_id
+    return cursor.fetchone()[0]
 
 
-def get_all_cuisines() -> list[dict]:
+def get_all_cuisines() -> list[Cuisine]:
     """Get all cuisines ordered alphabetically."""
     conn = get_db_connection()
     cursor = conn.execute("SELECT id, name FROM cuisines ORDER BY name ASC")
     rows = cursor.fetchall()
     conn.close()
-    return [{"id": row[0], "name": row[1]} for row in rows]
+    return [Cuisine.from_row(row) for row in rows]
 
 
 # Tag functions
-def get_or_create_tag(name: str) -> int:
-    """Get tag ID by name, or create if not exists. Name stored lowercase."""
-    name_lower = name.strip().lower()
-    conn = get_db_connection()
-    cursor = conn.execute("SELECT id FROM tags WHERE name = ?", (name_lower,))
-    row = cursor.fetchone()
-    if row:
-        tag_id = row[0]
-    else:
-        cursor = conn.execute("INSERT INTO tags (name) VALUES (?)", (name_lower,))
-        conn.commit()
-        tag_id = cursor.lastrowid
-    conn.close()
-    return tag_id
+def _add_tags(conn, recipe_id: int, tags: list[str]) -> None:
+    """Create tags as needed and link them to a recipe, without committing."""
+    for tag_name in _normalize_names(tags):
+        conn.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag_name,))
+        conn.execute(
+            "INSERT OR IGNORE INTO recipe_tags (recipe_id, tag_id) SELECT ?, id FROM tags WHERE name = ?",
+            (recipe_id, tag_name),
+        )
 
 
-def get_all_tags() -> list[dict]:
+def get_all_tags() -> list[Tag]:
     """Get all tags ordered alphabetically."""
     conn = get_db_connection()
     cursor = conn.execute("SELECT id, name FROM tags ORDER BY name ASC")
     rows = cursor.fetchall()
     conn.close()
-    return [{"id": row[0], "name": row[1]} for row in rows]
+    return [Tag.from_row(row) for row in rows]
 
 
-def get_tags_for_recipe(recipe_id: int) -> list[str]:
-    """Get all tag names for a recipe."""
+def get_tags_for_recipe(recipe_id: int) -> list[Tag]:
+    """Get all tags for a recipe."""
     conn = get_db_connection()
     cursor = conn.execute(
         """
-        SELECT t.name FROM tags t
+        SELECT t.id, t.name FROM tags t
         JOIN recipe_tags rt ON t.id = rt.tag_id
         WHERE rt.recipe_id = ?
         ORDER BY t.name ASC
@@ -67,11 +69,11 @@ def get_tags_for_recipe(recipe_id: int) -> list[str]:
     )
     rows = cursor.fetchall()
     conn.close()
-    return [row[0] for row in rows]
+    return [Tag.from_row(row) for row in rows]
 
 
 # URL functions
-def get_urls_for_recipe(recipe_id: int) -> list[dict]:
+def get_urls_for_recipe(recipe_id: int) -> list[RecipeUrl]:
     """Get all URLs for a recipe."""
     conn = get_db_connection()
     cursor = conn.execute(
@@ -80,7 +82,7 @@ def get_urls_for_recipe(recipe_id: int) -> list[dict]:
     )
     rows = cursor.fetchall()
     conn.close()
-    return [{"id": row[0], "url": row[1], "label": row[2]} for row in rows]
+    return [RecipeUrl.from_row(row) for row in rows]
 
 
 def add_url_to_recipe(recipe_id: int, url: str, label: str | None = None) -> int:
@@ -122,21 +124,22 @@ def delete_url(url_id: int) -> bool:
 # Recipe functions
 def create_recipe(
     name: str,
-    cuisine_id: int,
+    cuisine: str,
     urls: list[dict] | None = None,
     tags: list[str] | None = None,
     notes: str | None = None,
 ) -> int:
-    """Create a new recipe and return its ID.
+    """Create a new recipe in one transaction and return its ID.
 
+    The cuisine and tags are looked up by name and created if needed.
     urls should be a list of dicts with 'url' and optional 'label' keys.
     """
     conn = get_db_connection()
+    cuisine_id = _get_or_create_cuisine(conn, cuisine)
     cursor = conn.execute(
         "INSERT INTO recipes (name, cuisine_id, notes) VALUES (?, ?, ?)",
         (name.strip(), cuisine_id, notes),
     )
-    conn.commit()
     recipe_id = cursor.lastrowid
 
     # Add URLs if provided
@@ -149,25 +152,17 @@ def create_recipe(
                     "INSERT INTO recipe_urls (recipe_id, url, label) VALUES (?, ?, ?)",
                     (recipe_id, url, label),
                 )
-        conn.commit()
 
     # Add tags if provided
     if tags:
-        for tag_name in tags:
-            tag_name = tag_name.strip()
-            if tag_name:
-                tag_id = get_or_create_tag(tag_name)
-                conn.execute(
-                    "INSERT OR IGNORE INTO recipe_tags (recipe_id, tag_id) VALUES (?, ?)",
-                    (recipe_id, tag_id),
-                )
-        conn.commit()
+        _add_tags(conn, recipe_id, tags)
 
+    conn.commit()
     conn.close()
     return recipe_id
 
 
-def get_all_recipes(search_query: str | None = None) -> list[dict]:
+def get_all_recipes(search_query: str | None = None) -> list[Recipe]:
     """Get all recipes ordered by cuisine name, then recipe name.
 
     If search_query is provided, filter by name or tags (case-insensitive).
@@ -200,25 +195,13 @@ def get_all_recipes(search_query: str | None = None) -> list[dict]:
     rows = cursor.fetchall()
     conn.close()
 
-    recipes = []
-    for row in rows:
-        recipe_id = row[0]
-        urls = get_urls_for_recipe(recipe_id)
-        tags = get_tags_for_recipe(recipe_id)
-        recipes.append({
-            "id": recipe_id,
-            "name": row[1],
-            "notes": row[2],
-            "created_at": row[3],
-            "cuisine": row[4],
-            "cuisine_id": row[5],
-            "urls": urls,
-            "tags": tags,
-        })
-    return recipes
-
-
-def get_recipe_by_id(recipe_id: int) -> dict | None:
+    return [
+        Recipe.from_row(row, urls=get_urls_for_recipe(row[0]), tags=get_tags_for_recipe(row[0]))
+        for row in rows
+    ]
+
+
+def get_recipe_by_id(recipe_id: int) -> Recipe | None:
     """Get a single recipe by ID."""
     conn = get_db_connection()
     cursor = conn.execute(
@@ -234,18 +217,7 @@ def get_recipe_by_id(recipe_id: int) -> dict | None:
     conn.close()
     if row is None:
         return None
-    urls = get_urls_for_recipe(recipe_id)
-    tags = get_tags_for_recipe(recipe_id)
-    return {
-        "id": row[0],
-        "name": row[1],
-        "notes": row[2],
-        "created_at": row[3],
-        "cuisine": row[4],
-        "cuisine_id": row[5],
-        "urls": urls,
-        "tags": tags,
-    }
+    return Recipe.from_row(row, urls=get_urls_for_recipe(recipe_id), tags=get_tags_for_recipe(recipe_id))
 
 
 def update_recipe(
@@ -290,20 +262,28 @@ def update_recipe_name(recipe_id: int, new_name: str) -> bool:
     return update_recipe(recipe_id, name=new_name)
 
 
+def update_recipe_cuisine(recipe_id: int, cuisine: str) -> bool:
+    """Move a recipe to a cuisine by name, creating it if needed. Returns True if updated."""
+    conn = get_db_connection()
+    cuisine_id = _get_or_create_cuisine(conn, cuisine)
+    cursor = conn.execute("UPDATE recipes SET cuisine_id = ? WHERE id = ?", (cuisine_id, recipe_id))
+    updated = cursor.rowcount > 0
+    if updated:
+        conn.commit()
+    else:
+        # Don't leave a new cuisine behind for a recipe that doesn't exist
+        conn.rollback()
+    conn.close()
+    return updated
+
+
 def update_recipe_tags(recipe_id: int, tags: list[str]) -> None:
     """Replace all tags for a recipe with new ones."""
     conn = get_db_connection()
     # Remove existing tags
     conn.execute("DELETE FROM recipe_tags WHERE recipe_id = ?", (recipe_id,))
     # Add new tags
-    for tag_name in tags:
-        tag_name = tag_name.strip()
-        if tag_name:
-            tag_id = get_or_create_tag(tag_name)
-            conn.execute(
-                "INSERT OR IGNORE INTO recipe_tags (recipe_id, tag_id) VALUES (?, ?)",
-                (recipe_id, tag_id),
-            )
+    _add_tags(conn, recipe_id, tags)
     conn.commit()
     conn.close()
 
@@ -319,3 +299,170 @@ def delete_recipe(recipe_id: int) -> bool:
     deleted = cursor.rowcount > 0
     conn.close()
     return deleted
+
+
+# Bulk functions
+def delete_recipes(recipe_ids: list[int]) -> int:
+    """Delete many recipes in one transaction. Returns the number deleted."""
+    recipe_ids = list(dict.fromkeys(recipe_ids))
+    if not recipe_ids:
+        return 0
+    in_clause = _placeholders(recipe_ids)
+    conn = get_db_connection()
+    conn.execute(f"DELETE FROM recipe_tags WHERE recipe_id IN ({in_clause})", recipe_ids)
+    conn.execute(f"DELETE FROM recipe_urls WHERE recipe_id IN ({in_clause})", recipe_ids)
+    cursor = conn.execute(f"DELETE FROM recipes WHERE id IN ({in_clause})", recipe_ids)
+    conn.commit()
+    deleted = cursor.rowcount
+    conn.close()
+    return deleted
+
+
+def add_tag_to_recipes(recipe_ids: list[int], tag_name: str) -> int:
+    """Add a tag to many recipes in one transaction. Returns the number of recipes tagged."""
+    recipe_ids = list(dict.fromkeys(recipe_ids))
+    tag_name = tag_name.strip().lower()
+    if not recipe_ids or not tag_name:
+        return 0
+    conn = get_db_connection()
+    cursor = conn.execute(
+        f"SELECT COUNT(*) FROM recipes WHERE id IN ({_placeholders(recipe_ids)})", recipe_ids
+    )
+    if cursor.fetchone()[0] == 0:
+        # No such recipes, so don't create an unused tag
+        conn.close()
+        return 0
+    conn.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag_name,))
+    cursor = conn.execute(
+        f"""
+        INSERT OR IGNORE INTO recipe_tags (recipe_id, tag_id)
+        SELECT r.id, t.id FROM recipes r, tags t
+        WHERE r.id IN ({_placeholders(recipe_ids)}) AND t.name = ?
+        """,
+        [*recipe_ids, tag_name],
+    )
+    conn.commit()
+    added = cursor.rowcount
+    conn.close()
+    return added
+
+
+def remove_tag_from_recipes(recipe_ids: list[int], tag_name: str) -> int:
+    """Remove a tag from many recipes in one transaction. Returns the number of recipes untagged."""
+    recipe_ids = list(dict.fromkeys(recipe_ids))
+    tag_name = tag_name.strip().lower()
+    if not recipe_ids or not tag_name:
+        return 0
+    conn = get_db_connection()
+    cursor = conn.execute(
+        f"""
+        DELETE FROM recipe_tags
+        WHERE recipe_id IN ({_placeholders(recipe_ids)})
+        AND tag_id IN (SELECT id FROM tags WHERE name = ?)
+        """,
+        [*recipe_ids, tag_name],
+    )
+    conn.commit()
+    removed = cursor.rowcount
+    conn.close()
+    return removed
+
+
+def merge_tags(source_names: list[str], target_name: str) -> int:
+    """Merge tags into a target tag (created if needed) in one transaction.
+
+    Recipes tagged with any source tag are retagged with the target, and the
+    source tags are deleted. Returns the number of source tags removed.
+    """
+    source_names = _normalize_names(source_names)
+    target_name = target_name.strip().lower()
+    if not target_name:
+        return 0
+    source_names = [n for n in source_names if n != target_name]
+    if not source_names:
+        return 0
+    in_clause = _placeholders(source_names)
+    conn = get_db_connection()
+    cursor = conn.execute(f"SELECT COUNT(*) FROM tags WHERE name IN ({in_clause})", source_names)
+    if cursor.fetchone()[0] == 0:
+        # Nothing to merge, so don't create an unused target
+        conn.close()
+        return 0
+    conn.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (target_name,))
+    conn.execute(
+        f"""
+        INSERT OR IGNORE INTO recipe_tags (recipe_id, tag_id)
+        SELECT rt.recipe_id, (SELECT id FROM tags WHERE name = ?)
+        FROM recipe_tags rt
+        JOIN tags t ON rt.tag_id = t.id
+        WHERE t.name IN ({in_clause})
+        """,
+        [target_name, *source_names],
+    )
+    conn.execute(
+        f"DELETE FROM recipe_tags WHERE tag_id IN (SELECT id FROM tags WHERE name IN ({in_clause}))",
+        source_names,
+    )
+    cursor = conn.execute(f"DELETE FROM tags WHERE name IN ({in_clause})", source_names)
+    conn.commit()
+    merged = cursor.rowcount
+    conn.close()
+    return merged
+
+
+def rename_tag(old_name: str, new_name: str) -> int:
+    """Rename a tag, merging into an existing tag of the new name if there is one."""
+    return merge_tags([old_name], new_name)
+
+
+def merge_cuisines(source_names: list[str], target_name: str) -> int:
+    """Merge cuisines into a target cuisine (created if needed) in one transaction.
+
+    Recipes in any source cuisine are moved to the target, and the source
+    cuisines are deleted. Returns the number of source cuisines removed.
+    """
+    source_names = _normalize_names(source_names)
+    target_name = target_name.strip().lower()
+    if not target_name:
+        return 0
+    source_names = [n for n in source_names if n != target_name]
+    if not source_names:
+        return 0
+    in_clause = _placeholders(source_names)
+    conn = get_db_connection()
+    cursor = conn.execute(f"SELECT COUNT(*) FROM cuisines WHERE name IN ({in_clause})", source_names)
+    if cursor.fetchone()[0] == 0:
+        # Nothing to merge, so don't create an unused target
+        conn.close()
+        return 0
+    conn.execute("INSERT OR IGNORE INTO cuisines (name) VALUES (?)", (target_name,))
+    conn.execute(
+        f"""
+        UPDATE recipes SET cuisine_id = (SELECT id FROM cuisines WHERE name = ?)
+        WHERE cuisine_id IN (SELECT id FROM cuisines WHERE name IN ({in_clause}))
+        """,
+        [target_name, *source_names],
+    )
+    cursor = conn.execute(f"DELETE FROM cuisines WHERE name IN ({in_clause})", source_names)
+    conn.commit()
+    merged = cursor.rowcount
+    conn.close()
+    return merged
+
+
+def rename_cuisine(old_name: str, new_name: str) -> int:
+    """Rename a cuisine, merging into an existing cuisine of the new name if there is one."""
+    return merge_cuisines([old_name], new_name)
+
+
+def delete_orphans() -> dict:
+    """Delete tags and cuisines no recipe uses, in one transaction. Returns counts removed."""
+    conn = get_db_connection()
+    conn.execute("DELETE FROM recipe_tags WHERE recipe_id NOT IN (SELECT id FROM recipes)")
+    cursor = conn.execute("DELETE FROM tags WHERE id NOT IN (SELECT tag_id FROM recipe_tags)")
+    tags_deleted = cursor.rowcount
+    cursor = conn.execute("DELETE FROM cuisines WHERE id NOT IN (SELECT cuisine_id FROM recipes)")
+    cuisines_deleted = cursor.rowcount
+    conn.commit()
+    conn.close()
+    return {"tags": tags_deleted, "cuisines": cuisines_deleted}
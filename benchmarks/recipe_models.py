@@ -0,0 +1,85 @@
+"""Compare the memory footprint of dict vs slotted model recipe lists.
+
+Builds 100k recipes (each with one URL and two tags) from synthetic cursor
+rows, once the old way as dicts of dicts with tag-name strings, and once
+with app.recipes.models (a Cuisine and Tag object per recipe, as the service
+builds them). Reports memory retained by the finished list, peak traced memory
+during the build, and the number of live memory blocks the list retains.
+
+Run from the repo root: python -m benchmarks.recipe_models
+"""
+import gc
+import time
+import tracemalloc
+
+from app.recipes.models import Recipe, RecipeUrl, Tag
+
+N_RECIPES = 100_000
+
+
+def make_rows(n: int) -> tuple[list[tuple], list[tuple]]:
+    """Synthetic recipe and URL rows shaped like the service's cursor tuples."""
+    recipe_rows = [
+        (i, f"recipe {i}", None, "2025-01-01 00:00:00", "italian", 1) for i in range(n)
+    ]
+    url_rows = [(i, f"https://example.com/{i}", None) for i in range(n)]
+    return recipe_rows, url_rows
+
+
+def build_dicts(recipe_rows: list[tuple], url_rows: list[tuple]) -> list[dict]:
+    return [
+        {
+            "id": row[0],
+            "name": row[1],
+            "notes": row[2],
+            "created_at": row[3],
+            "cuisine": row[4],
+            "cuisine_id": row[5],
+            "urls": [{"id": u[0], "url": u[1], "label": u[2]}],
+            "tags": ["quick", "vegan"],
+        }
+        for row, u in zip(recipe_rows, url_rows)
+    ]
+
+
+def build_models(recipe_rows: list[tuple], url_rows: list[tuple]) -> list[Recipe]:
+    return [
+        Recipe.from_row(
+            row, urls=[RecipeUrl.from_row(u)], tags=[Tag.from_row((1, "quick")), Tag.from_row((2, "vegan"))]
+        )
+        for row, u in zip(recipe_rows, url_rows)
+    ]
+
+
+def measure(build, recipe_rows: list[tuple], url_rows: list[tuple]) -> tuple[int, int, int, float]:
+    """Return (retained bytes, peak bytes, retained blocks, seconds) for one build."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(recipe_rows, url_rows)
+    elapsed = time.perf_counter() - start
+    snapshot = tracemalloc.take_snapshot()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    del result
+    return retained, peak, blocks, elapsed
+
+
+def main():
+    recipe_rows, url_rows = make_rows(N_RECIPES)
+    results = {
+        "dicts": measure(build_dicts, recipe_rows, url_rows),
+        "models": measure(build_models, recipe_rows, url_rows),
+    }
+
+    print(f"{N_RECIPES:,} recipes")
+    print(f"{'':8}{'retained (MiB)':>16}{'peak (MiB)':>12}{'retained blocks':>17}{'time (s)':>10}")
+    for label, (retained, peak, blocks, elapsed) in results.items():
+        print(f"{label:8}{retained / 2**20:>16.1f}{peak / 2**20:>12.1f}{blocks:>17,}{elapsed:>10.3f}")
+    dict_bytes, model_bytes = results["dicts"][0], results["models"][0]
+    print(f"memory reduction: {1 - model_bytes / dict_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Production server settings: gunicorn master with uvicorn workers.
+
+Run with: gunicorn -c gunicorn.conf.py main:app
+"""
+import os
+
+from app.database import init_db_once
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Import the app once in the master; workers are forked from it
+preload_app = True
+
+
+def on_starting(server):
+    """Create the schema once in the master, before any worker is forked.
+
+    Workers inherit DB_SCHEMA_READY, so their lifespan skips init_db.
+    """
+    init_db_once()
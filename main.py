@@ -1,13 +1,44 @@
+import os
+from contextlib import asynccontextmanager
+
+import anyio
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from app.database import init_db
+from app.database import init_db_once, limiter, ping_db
+from app.limiter import DatabaseBusyError
 from app.recipes.router import router as recipes_router
 from app.recipes.service import get_all_cuisines, get_all_recipes, get_all_tags
 
-app = FastAPI(title="Kitchen Companion")
+# Paths that skip admission control. /health must answer even when the queue is full.
+HEALTH_PATH = "/health"
+STATIC_PREFIX = "/static/"
+
+# Threads beyond max_in_flight for handlers that don't touch the database
+THREADPOOL_HEADROOM = 10
+
+# Health probes run on their own threads so a busy threadpool can't delay them
+health_probe_threads = anyio.CapacityLimiter(2)
+
+# Seconds before a health probe gives up and reports the database unreachable
+HEALTH_PROBE_TIMEOUT = 3
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up and tear down per-worker resources."""
+    init_db_once()
+    # Admitted requests each need a threadpool thread; make sure there are enough
+    threads = anyio.to_thread.current_default_thread_limiter()
+    threads.total_tokens = max(threads.total_tokens, limiter.max_in_flight + THREADPOOL_HEADROOM)
+    await limiter.open()
+    yield
+    await limiter.close()
+
+
+app = FastAPI(title="Kitchen Companion", lifespan=lifespan)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -19,14 +50,28 @@ templates = Jinja2Templates(directory="templates")
 app.include_router(recipes_router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup."""
-    init_db()
+@app.middleware("http")
+async def admission_control(request: Request, call_next):
+    """Hold one limiter slot per request, or shed it with a 503 before any work is done."""
+    path = request.url.path
+    if path == HEALTH_PATH or path.startswith(STATIC_PREFIX):
+        return await call_next(request)
+    try:
+        await limiter.acquire()
+    except DatabaseBusyError as exc:
+        return HTMLResponse(
+            content="Server is busy, please retry shortly.",
+            status_code=503,
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+    try:
+        return await call_next(request)
+    finally:
+        await limiter.release()
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request):
+def index(request: Request):
     """Render the recipe list as the homepage."""
     recipes = get_all_recipes()
     cuisines = get_all_cuisines()
@@ -38,12 +83,29 @@ async def index(request: Request):
     )
 
 
-@app.get("/health")
+@app.get(HEALTH_PATH)
 async def health_check():
-    """Health check endpoint for deployment."""
-    return {"status": "healthy"}
+    """Health check endpoint for deployment. Exempt from database admission control."""
+    try:
+        with anyio.fail_after(HEALTH_PROBE_TIMEOUT):
+            # A hung probe thread is abandoned; it keeps its slot until it returns
+            healthy = await anyio.to_thread.run_sync(
+                ping_db, abandon_on_cancel=True, limiter=health_probe_threads
+            )
+    except TimeoutError:
+        healthy = False
+    return JSONResponse(
+        content={
+            "status": "healthy" if healthy else "unhealthy",
+            "database": "reachable" if healthy else "unreachable",
+            **limiter.stats(),
+        },
+        status_code=200 if healthy else 503,
+    )
 
 
 if __name__ == "__main__":
+    # Single-process server for local development. Production runs several
+    # workers under gunicorn; see gunicorn.conf.py.
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "8000")))
\ No newline at end of file
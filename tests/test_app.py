@@ -0,0 +1,72 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.limiter import AdmissionLimiter
+from app.recipes import router
+
+
+@pytest.fixture
+def client():
+    # No `with` block: lifespan would initialize the real database
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def full_limiter(monkeypatch):
+    """A limiter with no free slots and no room to queue."""
+    limiter = AdmissionLimiter(max_in_flight=0, max_queue=0, timeout=1, retry_after=7)
+    monkeypatch.setattr(main, "limiter", limiter)
+    return limiter
+
+
+@pytest.fixture
+def no_handler_work(monkeypatch):
+    def fail():
+        raise AssertionError("shed request reached its handler")
+
+    monkeypatch.setattr(router, "get_all_tags", fail)
+
+
+def test_full_queue_sheds_with_retry_after(client, full_limiter, no_handler_work):
+    response = client.get("/recipes/tags")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+
+
+def test_health_skips_admission_control(client, full_limiter, monkeypatch):
+    monkeypatch.setattr(main, "ping_db", lambda: True)
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "healthy",
+        "database": "reachable",
+        "in_flight": 0,
+        "waiting": 0,
+        "max_in_flight": 0,
+        "max_queue": 0,
+    }
+
+
+def test_health_prefix_paths_are_not_exempt(client, full_limiter):
+    assert client.get("/healthz").status_code == 503
+    assert client.get("/staticx").status_code == 503
+
+
+def test_health_reports_unreachable_database(client, monkeypatch):
+    monkeypatch.setattr(main, "ping_db", lambda: False)
+    response = client.get("/health")
+    assert response.status_code == 503
+    assert response.json()["database"] == "unreachable"
+
+
+def test_health_times_out_hung_probe(client, monkeypatch):
+    monkeypatch.setattr(main, "ping_db", lambda: time.sleep(1) or True)
+    monkeypatch.setattr(main, "HEALTH_PROBE_TIMEOUT", 0.05)
+    start = time.monotonic()
+    response = client.get("/health")
+    assert time.monotonic() - start < 0.5
+    assert response.status_code == 503
+    assert response.json()["status"] == "unhealthy"
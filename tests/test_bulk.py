@@ -0,0 +1,137 @@
+import sqlite3
+
+import pytest
+
+from app import database
+from app.recipes import service
+
+
+@pytest.fixture(autouse=True)
+def db(tmp_path, monkeypatch):
+    """Point the service layer at a fresh SQLite file with the app schema."""
+    path = tmp_path / "recipes.db"
+
+    def connect():
+        return sqlite3.connect(path)
+
+    monkeypatch.setattr(database, "get_db_connection", connect)
+    monkeypatch.setattr(service, "get_db_connection", connect)
+    database.init_db()
+    return path
+
+
+def tag_names():
+    return [t.name for t in service.get_all_tags()]
+
+
+def cuisine_names():
+    return [c.name for c in service.get_all_cuisines()]
+
+
+def recipe_tags(recipe_id):
+    return [t.name for t in service.get_tags_for_recipe(recipe_id)]
+
+
+def test_delete_recipes_removes_recipes_and_links():
+    a = service.create_recipe("A", "italian", urls=[{"url": "https://a"}], tags=["quick"])
+    b = service.create_recipe("B", "italian", tags=["quick"])
+    c = service.create_recipe("C", "french")
+
+    assert service.delete_recipes([a, b, a, 999]) == 2
+    assert [r.id for r in service.get_all_recipes()] == [c]
+    assert service.get_urls_for_recipe(a) == []
+    assert recipe_tags(a) == []
+
+
+def test_add_tag_dedups_existing_links():
+    a = service.create_recipe("A", "italian", tags=["Quick"])
+    b = service.create_recipe("B", "italian")
+
+    assert service.add_tag_to_recipes([a, b], " QUICK ") == 1
+    assert recipe_tags(a) == ["quick"]
+    assert recipe_tags(b) == ["quick"]
+    assert tag_names() == ["quick"]
+
+
+def test_add_tag_to_missing_recipes_creates_no_tag():
+    assert service.add_tag_to_recipes([424242], "ghost") == 0
+    assert tag_names() == []
+
+
+def test_remove_tag_from_recipes():
+    a = service.create_recipe("A", "italian", tags=["quick", "vegan"])
+    b = service.create_recipe("B", "italian", tags=["quick"])
+
+    assert service.remove_tag_from_recipes([a, b], "quick") == 2
+    assert recipe_tags(a) == ["vegan"]
+    assert recipe_tags(b) == []
+
+
+def test_merge_tags_into_existing_target():
+    a = service.create_recipe("A", "italian", tags=["fast", "quick"])
+    b = service.create_recipe("B", "italian", tags=["speedy"])
+
+    assert service.merge_tags(["fast", "speedy", "quick"], "quick") == 2
+    assert recipe_tags(a) == ["quick"]
+    assert recipe_tags(b) == ["quick"]
+    assert tag_names() == ["quick"]
+
+
+def test_rename_tag_to_new_name():
+    a = service.create_recipe("A", "italian", tags=["weeknight"])
+
+    assert service.rename_tag("weeknight", "Busy Night") == 1
+    assert recipe_tags(a) == ["busy night"]
+    assert tag_names() == ["busy night"]
+
+
+def test_merge_cuisines_into_existing_target():
+    a = service.create_recipe("A", "italian")
+    b = service.create_recipe("B", "italiano")
+
+    assert service.merge_cuisines(["italiano"], "Italian") == 1
+    assert service.get_recipe_by_id(a).cuisine == service.get_recipe_by_id(b).cuisine
+    assert cuisine_names() == ["italian"]
+
+
+def test_rename_cuisine_to_new_name():
+    a = service.create_recipe("A", "italiano")
+
+    assert service.rename_cuisine("italiano", "italian") == 1
+    assert service.get_recipe_by_id(a).cuisine.name == "italian"
+    assert cuisine_names() == ["italian"]
+
+
+def test_merge_without_existing_sources_creates_nothing():
+    service.create_recipe("A", "italian", tags=["quick"])
+
+    assert service.merge_tags(["nope"], "ghost") == 0
+    assert service.merge_cuisines(["nope"], "ghost") == 0
+    assert service.merge_tags(["quick"], "quick") == 0
+    assert tag_names() == ["quick"]
+    assert cuisine_names() == ["italian"]
+
+
+def test_delete_orphans_counts():
+    a = service.create_recipe("A", "italian", tags=["quick", "vegan"])
+    service.create_recipe("B", "french", tags=["quick"])
+    service.delete_recipes([a])
+
+    assert service.delete_orphans() == {"tags": 1, "cuisines": 1}
+    assert tag_names() == ["quick"]
+    assert cuisine_names() == ["french"]
+    assert service.delete_orphans() == {"tags": 0, "cuisines": 0}
+
+
+def test_create_recipe_is_one_transaction():
+    with pytest.raises(AttributeError):
+        service.create_recipe("A", "italian", urls=["not a dict"], tags=["quick"])
+
+    assert cuisine_names() == []
+    assert tag_names() == []
+    assert service.get_all_recipes() == []
+
+
+def test_update_recipe_cuisine_for_missing_recipe_creates_nothing():
+    assert service.update_recipe_cuisine(424242, "ghost") is False
+    assert cuisine_names() == []
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from app.limiter import AdmissionLimiter, DatabaseBusyError
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_admits_up_to_max_in_flight():
+    async def scenario():
+        limiter = AdmissionLimiter(max_in_flight=2, max_queue=0, timeout=1)
+        await limiter.acquire()
+        await limiter.acquire()
+        assert limiter.stats()["in_flight"] == 2
+        await limiter.release()
+        await limiter.release()
+        assert limiter.stats()["in_flight"] == 0
+
+    run(scenario())
+
+
+def test_full_queue_sheds_immediately():
+    async def scenario():
+        limiter = AdmissionLimiter(max_in_flight=1, max_queue=1, timeout=5, retry_after=3)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+        with pytest.raises(DatabaseBusyError) as exc_info:
+            await asyncio.wait_for(limiter.acquire(), timeout=0.5)
+        assert exc_info.value.retry_after == 3
+        await limiter.release()
+        await waiter
+        assert limiter.in_flight == 1
+
+    run(scenario())
+
+
+def test_wait_times_out():
+    async def scenario():
+        limiter = AdmissionLimiter(max_in_flight=1, max_queue=5, timeout=0.05)
+        await limiter.acquire()
+        with pytest.raises(DatabaseBusyError):
+            await limiter.acquire()
+        assert limiter.waiting == 0
+        assert limiter.in_flight == 1
+
+    run(scenario())
+
+
+def test_release_wakes_waiter():
+    async def scenario():
+        limiter = AdmissionLimiter(max_in_flight=1, max_queue=5, timeout=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        await limiter.release()
+        await asyncio.wait_for(waiter, timeout=0.5)
+        assert limiter.in_flight == 1
+        assert limiter.waiting == 0
+
+    run(scenario())
+
+
+def test_close_sheds_waiters_and_new_requests():
+    async def scenario():
+        limiter = AdmissionLimiter(max_in_flight=1, max_queue=5, timeout=5)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        await limiter.close()
+        with pytest.raises(DatabaseBusyError):
+            await asyncio.wait_for(waiter, timeout=0.5)
+        with pytest.raises(DatabaseBusyError):
+            await limiter.acquire()
+        await limiter.release()
+        await limiter.open()
+        await limiter.acquire()
+        assert limiter.in_flight == 1
+
+    run(scenario())